@@ -8,6 +8,7 @@ use std::collections::BTreeMap;
 use std::path::PathBuf;
 use std::sync::mpsc::{channel, Receiver, Sender};
 use std::thread;
+use std::time::SystemTime;
 use tui::backend::Backend;
 use tui::layout::{Constraint, Direction, Layout, Rect};
 use tui::style::{Color, Style};
@@ -21,6 +22,7 @@ pub struct CommandBar<B: Backend> {
     views: Vec<Box<dyn View<Backend=B>>>,
     command_line: String,
     command_filepath: Option<PathBuf>,
+    commands_cache: Option<(SystemTime, BTreeMap<String, String>)>,
     history: Vec<String>,
     error_pop_up: Option<ErrorPopUp<B>>,
     command_list: CommandList,
@@ -97,25 +99,19 @@ impl<B: Backend + Send> CommandBar<B> {
             return;
         };
 
-        let yaml_content = self.load_commands(&filepath);
-        if yaml_content.is_empty() {
+        let pattern = self.command_line.clone();
+        let Some(yaml_content) = self.load_commands(&filepath) else {
             return;
-        }
+        };
 
-        let cmd_line = self.command_line.strip_prefix('/').unwrap();
+        let cmd_line = pattern.strip_prefix('/').unwrap();
         let cmds = yaml_content
             .keys()
-            .filter_map(|x| {
-                if x.starts_with(cmd_line) {
-                    Some(x.clone())
-                } else {
-                    None
-                }
-            })
+            .filter(|x| x.starts_with(cmd_line))
+            .cloned()
             .collect::<Vec<_>>();
 
-        self.command_list
-            .update_params(cmds, self.command_line.clone());
+        self.command_list.update_params(cmds, pattern);
     }
 
     fn get_view_frame_size(term_size: Rect) -> (u16, u16) {
@@ -145,6 +141,16 @@ impl<B: Backend + Send> CommandBar<B> {
         Ok(res)
     }
 
+    fn scroll_to_end(&mut self, term_size: Rect) {
+        let height = term_size.height as usize - 5;
+        let frame_size = CommandBar::<B>::get_view_frame_size(term_size);
+        let max_main_axis = self.views[self.view].max_main_axis(frame_size);
+
+        if max_main_axis > height {
+            self.scroll.0 = max_main_axis - height;
+        }
+    }
+
     fn handle_key_input(&mut self, key: KeyEvent, term_size: Rect) -> Result<(), ()> {
         match key.code {
             KeyCode::Char('s') if key.modifiers == KeyModifiers::CONTROL => {
@@ -154,25 +160,11 @@ impl<B: Backend + Send> CommandBar<B> {
             }
             KeyCode::Char('o') if key.modifiers == KeyModifiers::CONTROL => {
                 self.views[self.view].toggle_snapshot_mode();
-
-                let height = term_size.height as usize - 5;
-                let frame_size = CommandBar::<B>::get_view_frame_size(term_size);
-                let max_main_axis = self.views[self.view].max_main_axis(frame_size);
-
-                if max_main_axis > height {
-                    self.scroll.0 = max_main_axis - height;
-                }
+                self.scroll_to_end(term_size);
             }
             KeyCode::Char('k') if key.modifiers == KeyModifiers::CONTROL => {
                 self.views[self.view].toggle_auto_scroll();
-
-                let height = term_size.height as usize - 5;
-                let frame_size = CommandBar::<B>::get_view_frame_size(term_size);
-                let max_main_axis = self.views[self.view].max_main_axis(frame_size);
-
-                if max_main_axis > height {
-                    self.scroll.0 = max_main_axis - height;
-                }
+                self.scroll_to_end(term_size);
             }
             KeyCode::Char('l') if key.modifiers == KeyModifiers::CONTROL => self.clear_views(),
             KeyCode::Char('q') if key.modifiers == KeyModifiers::CONTROL => {
@@ -188,8 +180,7 @@ impl<B: Backend + Send> CommandBar<B> {
             }
             KeyCode::Esc => return Err(()),
             KeyCode::Enter if !self.command_line.is_empty() => {
-                let command_line = self.command_line.clone();
-                self.command_line.clear();
+                let command_line = std::mem::take(&mut self.command_line);
                 self.command_list.clear();
 
                 match command_line.chars().next().unwrap() {
@@ -199,40 +190,48 @@ impl<B: Backend + Send> CommandBar<B> {
                             return Ok(());
                         };
 
-                        let yaml_content = self.load_commands(&filepath);
-                        if yaml_content.is_empty() {
+                        let Some(yaml_content) = self.load_commands(&filepath) else {
                             return Ok(());
-                        }
+                        };
 
                         let key = command_line.strip_prefix('/').unwrap();
 
-                        if !yaml_content.contains_key(key) {
+                        let Some(data_to_send) = yaml_content.get(key).cloned() else {
                             self.set_error_pop_up(format!("Command </{key}> not found"));
                             return Ok(());
-                        }
+                        };
 
-                        let data_to_send = yaml_content.get(key).unwrap();
                         self.interface
-                            .send(DataIn::Command(key.to_string(), data_to_send.to_string()));
+                            .send(DataIn::Command(key.to_string(), data_to_send));
                     }
                     '!' => {
-                        let command_line_split= command_line.strip_prefix('!').unwrap().
-                            split_whitespace().collect::<Vec<_>>();
-                        match command_line_split[0]
-                            .to_lowercase()
-                            .as_ref()
-                        {
-                            "clear" | "clean" => self.clear_views(),
-                            "port" => {
-                                self.interface.set_port(command_line_split[1].to_string());
+                        let mut args = command_line.strip_prefix('!').unwrap().split_whitespace();
+                        let command_name = args.next().unwrap_or_default().to_lowercase();
+
+                        match (command_name.as_str(), args.next()) {
+                            ("clear" | "clean", _) => self.clear_views(),
+                            ("port", Some(port)) => {
+                                self.interface.set_port(port.to_string());
                             }
-                            "baudrate" =>{
-                                self.interface.set_baudrate(command_line_split[1].parse::<u32>().unwrap());
+                            ("baudrate", Some(baudrate)) => {
+                                let Ok(baudrate) = baudrate.parse::<u32>() else {
+                                    self.set_error_pop_up(format!("Invalid baudrate: {baudrate}"));
+                                    return Ok(());
+                                };
+
+                                self.interface.set_baudrate(baudrate);
+                            }
+                            ("port" | "baudrate", None) => {
+                                self.set_error_pop_up(format!(
+                                    "Command <!{command_name}> needs an argument"
+                                ));
+                                return Ok(());
                             }
                             _ => {
                                 self.set_error_pop_up(format!(
-                                    "Command <!{command_line}> not found"
+                                    "Command <{command_line}> not found"
                                 ));
+                                return Ok(());
                             }
                         }
                     }
@@ -276,26 +275,24 @@ impl<B: Backend + Send> CommandBar<B> {
             }
         }
 
-        if let Ok(data_out) = self.interface.try_recv() {
+        while let Ok(data_out) = self.interface.try_recv() {
             for view in self.views.iter_mut() {
                 view.add_data_out(data_out.clone());
             }
         }
 
-        let Ok(input_evt) = self.key_receiver.try_recv() else {
-            return Ok(());
-        };
-
-        match input_evt {
-            Key(key) => return self.handle_key_input(key, term_size),
-            VerticalScroll(direction) => {
-                let frame_size = CommandBar::<B>::get_view_frame_size(term_size);
-                let max_main_axis = self.views[self.view].max_main_axis(frame_size);
-
-                if direction < 0 && self.scroll.0 > 0 {
-                    self.scroll.0 -= 1;
-                } else if self.scroll.0 < (max_main_axis - 1) {
-                    self.scroll.0 += 1;
+        while let Ok(input_evt) = self.key_receiver.try_recv() {
+            match input_evt {
+                Key(key) => self.handle_key_input(key, term_size)?,
+                VerticalScroll(direction) => {
+                    let frame_size = CommandBar::<B>::get_view_frame_size(term_size);
+                    let max_main_axis = self.views[self.view].max_main_axis(frame_size);
+
+                    if direction < 0 && self.scroll.0 > 0 {
+                        self.scroll.0 -= 1;
+                    } else if self.scroll.0 < (max_main_axis - 1) {
+                        self.scroll.0 += 1;
+                    }
                 }
             }
         }
@@ -303,23 +300,35 @@ impl<B: Backend + Send> CommandBar<B> {
         Ok(())
     }
 
-    fn load_commands(&mut self, filepath: &PathBuf) -> BTreeMap<String, String> {
-        let Ok(yaml) = std::fs::read(filepath) else {
+    fn load_commands(&mut self, filepath: &PathBuf) -> Option<&BTreeMap<String, String>> {
+        let Ok(modified) = std::fs::metadata(filepath).and_then(|m| m.modified()) else {
             self.set_error_pop_up(format!("Cannot find {filepath:?} filepath"));
-            return BTreeMap::new();
+            return None;
         };
 
-        let Ok(yaml_str) = std::str::from_utf8(yaml.as_slice()) else {
-            self.set_error_pop_up(format!("The file {filepath:?} has non UTF-8 characters"));
-            return BTreeMap::new();
-        };
+        let is_cached =
+            matches!(self.commands_cache, Some((cached_at, _)) if cached_at == modified);
 
-        let Ok(commands) = serde_yaml::from_str(yaml_str) else {
-            self.set_error_pop_up(format!("The YAML from {filepath:?} has an incorret format"));
-            return BTreeMap::new();
-        };
+        if !is_cached {
+            let Ok(yaml) = std::fs::read(filepath) else {
+                self.set_error_pop_up(format!("Cannot find {filepath:?} filepath"));
+                return None;
+            };
+
+            let Ok(yaml_str) = std::str::from_utf8(yaml.as_slice()) else {
+                self.set_error_pop_up(format!("The file {filepath:?} has non UTF-8 characters"));
+                return None;
+            };
+
+            let Ok(commands) = serde_yaml::from_str(yaml_str) else {
+                self.set_error_pop_up(format!("The YAML from {filepath:?} has an incorret format"));
+                return None;
+            };
+
+            self.commands_cache = Some((modified, commands));
+        }
 
-        commands
+        self.commands_cache.as_ref().map(|(_, commands)| commands)
     }
 }
 
@@ -340,6 +349,7 @@ impl<B: Backend> CommandBar<B> {
             key_receiver,
             error_pop_up: None,
             command_filepath: None,
+            commands_cache: None,
             command_list: CommandList::new(),
             scroll: (0, 0),
         }
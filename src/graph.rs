@@ -2,6 +2,7 @@ use crate::interface::DataOut;
 use crate::view::View;
 use chrono::{DateTime, Local};
 use std::cmp::{max, max_by, min_by};
+use std::collections::VecDeque;
 use std::marker::PhantomData;
 use tui::backend::Backend;
 use tui::layout::Rect;
@@ -12,7 +13,7 @@ use tui::widgets::{Axis, Block, Borders, Chart, Dataset};
 use tui::Frame;
 
 pub struct GraphView<B: Backend> {
-    history: Vec<GraphData>,
+    history: VecDeque<GraphData>,
     capacity: usize,
     _marker: PhantomData<B>,
 }
@@ -20,7 +21,7 @@ pub struct GraphView<B: Backend> {
 impl<B: Backend> GraphView<B> {
     pub fn new(capacity: usize) -> Self {
         Self {
-            history: vec![],
+            history: VecDeque::new(),
             capacity,
             _marker: PhantomData,
         }
@@ -59,8 +60,8 @@ impl<B: Backend> GraphView<B> {
         self.history.iter().fold(0.0, |top, x| {
             let max_point = x
                 .points
-                .clone()
-                .into_iter()
+                .iter()
+                .copied()
                 .max_by(|a, b| a.total_cmp(b))
                 .unwrap_or(0.0);
             max_by(top, max_point, |a, b| a.total_cmp(b))
@@ -71,8 +72,8 @@ impl<B: Backend> GraphView<B> {
         self.history.iter().fold(0.0, |bottom, x| {
             let min_point = x
                 .points
-                .clone()
-                .into_iter()
+                .iter()
+                .copied()
                 .min_by(|a, b| a.total_cmp(b))
                 .unwrap_or(0.0);
             min_by(bottom, min_point, |a, b| a.total_cmp(b))
@@ -84,19 +85,19 @@ impl<B: Backend> GraphView<B> {
     }
 }
 
-const MARKERS: [(Color, Marker); 12] = [
-    (Color::Cyan, Marker::Dot),
-    (Color::Yellow, Marker::Dot),
-    (Color::Green, Marker::Dot),
-    (Color::Red, Marker::Dot),
-    (Color::Blue, Marker::Dot),
-    (Color::Magenta, Marker::Dot),
-    (Color::Cyan, Marker::Block),
-    (Color::Yellow, Marker::Block),
-    (Color::Green, Marker::Block),
-    (Color::Red, Marker::Block),
-    (Color::Blue, Marker::Block),
-    (Color::Magenta, Marker::Block),
+const MARKERS: [(Color, Marker, &str); 12] = [
+    (Color::Cyan, Marker::Dot, "•"),
+    (Color::Yellow, Marker::Dot, "•"),
+    (Color::Green, Marker::Dot, "•"),
+    (Color::Red, Marker::Dot, "•"),
+    (Color::Blue, Marker::Dot, "•"),
+    (Color::Magenta, Marker::Dot, "•"),
+    (Color::Cyan, Marker::Block, "▮"),
+    (Color::Yellow, Marker::Block, "▮"),
+    (Color::Green, Marker::Block, "▮"),
+    (Color::Red, Marker::Block, "▮"),
+    (Color::Blue, Marker::Block, "▮"),
+    (Color::Magenta, Marker::Block, "▮"),
 ];
 
 impl<B: Backend> View for GraphView<B> {
@@ -112,8 +113,8 @@ impl<B: Backend> View for GraphView<B> {
         };
 
         let window = rect.width as usize;
-        let x_min = x_limit(self.history.first());
-        let x_max = x_limit(self.history.last());
+        let x_min = x_limit(self.history.front());
+        let x_max = x_limit(self.history.back());
         let x_min = if self.history.len() > window {
             x_limit(self.history.get(self.history.len() - window))
         } else {
@@ -134,19 +135,11 @@ impl<B: Backend> View for GraphView<B> {
             .iter()
             .enumerate()
             .map(|(i, data)| {
-                let marker_idx = i % MARKERS.len();
-                let marker = MARKERS[marker_idx].1;
+                let (color, marker, symbol) = MARKERS[i % MARKERS.len()];
                 Dataset::default()
-                    .name(format!(
-                        "{} data{i}",
-                        match marker {
-                            Marker::Dot => "•",
-                            Marker::Block => "▮",
-                            Marker::Braille => "",
-                        }
-                    ))
+                    .name(format!("{symbol} data{i}"))
                     .marker(marker)
-                    .style(Style::default().fg(MARKERS[marker_idx].0))
+                    .style(Style::default().fg(color))
                     .data(data)
             })
             .collect();
@@ -173,13 +166,13 @@ impl<B: Backend> View for GraphView<B> {
 
     fn add_data_out(&mut self, data: DataOut) {
         if self.history.len() >= self.capacity {
-            self.history.remove(0);
+            self.history.pop_front();
         }
 
         match data {
             DataOut::Data(timestamp, data) => {
                 if let Some(graph_data) = GraphData::data(timestamp, data) {
-                    self.history.push(graph_data);
+                    self.history.push_back(graph_data);
                 }
             }
             DataOut::ConfirmData(_, _) => {}
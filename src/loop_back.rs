@@ -2,12 +2,13 @@ use crate::interface::{DataIn, DataOut, Interface};
 use chrono::Local;
 use rand::rngs::ThreadRng;
 use rand::Rng;
+use std::cmp::min;
 use std::sync::atomic::{AtomicBool, Ordering};
 use std::sync::mpsc::{channel, Receiver, Sender, TryRecvError};
 use std::sync::Arc;
 use std::thread;
 use std::thread::sleep;
-use std::time::Duration;
+use std::time::{Duration, Instant};
 use tui::style::Color;
 
 pub struct LoopBackIF {
@@ -15,10 +16,12 @@ pub struct LoopBackIF {
     data_rx: Receiver<DataOut>,
     send_interval: Duration,
     is_connected: Arc<AtomicBool>,
+    is_running: Arc<AtomicBool>,
 }
 
 impl Drop for LoopBackIF {
     fn drop(&mut self) {
+        self.is_running.store(false, Ordering::SeqCst);
         self.if_tx.send(DataIn::Exit).unwrap()
     }
 }
@@ -69,28 +72,55 @@ impl LoopBackIF {
         let is_connected = Arc::new(AtomicBool::new(false));
         let is_connected2 = is_connected.clone();
         let is_connected3 = is_connected.clone();
-        let is_connected4 = is_connected.clone();
+
+        let is_running = Arc::new(AtomicBool::new(true));
+        let is_running2 = is_running.clone();
 
         thread::spawn(move || {
             LoopBackIF::task(if_rx, data_tx, is_connected2);
         });
 
-        thread::spawn(move || loop {
-            sleep(send_interval);
-            if is_connected3.load(Ordering::SeqCst) {
-                data_tx2
-                    .send(DataOut::Data(Local::now(), data_to_send()))
-                    .expect("Cannot forward message read from loopback");
-            }
-        });
-
-        thread::spawn(move || loop {
-            sleep(LoopBackIF::UPDATE_CONNECTION_INTERVAL);
+        thread::spawn(move || {
             let mut rng = rand::thread_rng();
-            if is_connected4.load(Ordering::SeqCst) {
-                LoopBackIF::rng_disconnet(&mut rng, is_connected4.clone());
-            } else {
-                LoopBackIF::reconnect(&mut rng, is_connected4.clone());
+            let mut send_deadline = Instant::now() + send_interval;
+            let mut update_deadline = Instant::now() + LoopBackIF::UPDATE_CONNECTION_INTERVAL;
+
+            loop {
+                let deadline = min(send_deadline, update_deadline);
+                sleep(deadline.saturating_duration_since(Instant::now()));
+                if !is_running2.load(Ordering::SeqCst) {
+                    break;
+                }
+
+                let now = Instant::now();
+
+                if now >= update_deadline {
+                    update_deadline += LoopBackIF::UPDATE_CONNECTION_INTERVAL;
+                    if update_deadline <= now {
+                        update_deadline = now + LoopBackIF::UPDATE_CONNECTION_INTERVAL;
+                    }
+
+                    if is_connected3.load(Ordering::SeqCst) {
+                        LoopBackIF::rng_disconnet(&mut rng, &is_connected3);
+                    } else {
+                        LoopBackIF::reconnect(&mut rng, &is_connected3);
+                    }
+                }
+
+                if now >= send_deadline {
+                    send_deadline += send_interval;
+                    if send_deadline <= now {
+                        send_deadline = now + send_interval;
+                    }
+
+                    if is_connected3.load(Ordering::SeqCst)
+                        && data_tx2
+                            .send(DataOut::Data(Local::now(), data_to_send()))
+                            .is_err()
+                    {
+                        break;
+                    }
+                }
             }
         });
 
@@ -99,59 +129,58 @@ impl LoopBackIF {
             data_rx,
             send_interval,
             is_connected,
+            is_running,
         }
     }
 
-    fn reconnect(rng: &mut ThreadRng, is_connected: Arc<AtomicBool>) {
+    fn reconnect(rng: &mut ThreadRng, is_connected: &AtomicBool) {
         if rng.gen::<f32>() <= LoopBackIF::RECONNECT_RATE {
             is_connected.store(true, Ordering::SeqCst);
         }
     }
 
-    fn rng_disconnet(rng: &mut ThreadRng, is_connected: Arc<AtomicBool>) {
+    fn rng_disconnet(rng: &mut ThreadRng, is_connected: &AtomicBool) {
         if rng.gen::<f32>() <= LoopBackIF::DISCONNECT_RATE {
             is_connected.store(false, Ordering::SeqCst);
         }
     }
 
     fn task(if_rx: Receiver<DataIn>, data_tx: Sender<DataOut>, is_connected: Arc<AtomicBool>) {
-        'task: loop {
-            if let Ok(data_to_send) = if_rx.try_recv() {
-                match data_to_send {
-                    DataIn::Exit => break 'task,
-                    DataIn::Data(data_to_send) => {
-                        if is_connected.load(Ordering::SeqCst) {
-                            data_tx
-                                .send(DataOut::ConfirmData(Local::now(), data_to_send))
-                                .expect("Cannot send data confirm");
-                        } else {
-                            data_tx
-                                .send(DataOut::FailData(Local::now(), data_to_send))
-                                .expect("Cannot send data fail");
-                        }
+        'task: while let Ok(data_to_send) = if_rx.recv() {
+            match data_to_send {
+                DataIn::Exit => break 'task,
+                DataIn::Data(data_to_send) => {
+                    if is_connected.load(Ordering::SeqCst) {
+                        data_tx
+                            .send(DataOut::ConfirmData(Local::now(), data_to_send))
+                            .expect("Cannot send data confirm");
+                    } else {
+                        data_tx
+                            .send(DataOut::FailData(Local::now(), data_to_send))
+                            .expect("Cannot send data fail");
                     }
-                    DataIn::Command(command_name, data_to_send) => {
-                        if is_connected.load(Ordering::SeqCst) {
-                            data_tx
-                                .send(DataOut::ConfirmCommand(
-                                    Local::now(),
-                                    command_name,
-                                    data_to_send,
-                                ))
-                                .expect("Cannot send command confirm");
-                        } else {
-                            data_tx
-                                .send(DataOut::FailCommand(
-                                    Local::now(),
-                                    command_name,
-                                    data_to_send,
-                                ))
-                                .expect("Cannot send command fail");
-                        }
+                }
+                DataIn::Command(command_name, data_to_send) => {
+                    if is_connected.load(Ordering::SeqCst) {
+                        data_tx
+                            .send(DataOut::ConfirmCommand(
+                                Local::now(),
+                                command_name,
+                                data_to_send,
+                            ))
+                            .expect("Cannot send command confirm");
+                    } else {
+                        data_tx
+                            .send(DataOut::FailCommand(
+                                Local::now(),
+                                command_name,
+                                data_to_send,
+                            ))
+                            .expect("Cannot send command fail");
                     }
-                    DataIn::HexString(_) => todo!(),
                 }
-            };
+                DataIn::HexString(_) => todo!(),
+            }
         }
     }
 }
@@ -56,6 +56,7 @@ impl Interface for SerialIF {
 impl SerialIF {
     const SERIAL_TIMEOUT: Duration = Duration::from_millis(10);
     const RECONNECT_INTERVAL: Duration = Duration::from_millis(200);
+    const READ_BUFFER_SIZE: usize = 64;
 
     pub fn new(port: &str, baudrate: u32) -> Self {
         let (serial_tx, serial_rx) = channel();
@@ -116,8 +117,8 @@ impl SerialIF {
             is_connected.clone(),
         );
 
-        let mut line = String::new();
-        let mut buffer = [0u8];
+        let mut line = vec![];
+        let mut buffer = [0u8; SerialIF::READ_BUFFER_SIZE];
 
         'task: loop {
             if let Ok(data_to_send) = serial_rx.try_recv() {
@@ -160,7 +161,9 @@ impl SerialIF {
                         }
                     }
                     DataIn::HexString(bytes) => {
-                        let content = [bytes.clone(), b"\r\n".to_vec()].concat();
+                        let mut content = Vec::with_capacity(bytes.len() + 2);
+                        content.extend_from_slice(&bytes);
+                        content.extend_from_slice(b"\r\n");
                         match serial.write(&content) {
                             Ok(_) => data_tx
                                 .send(DataOut::ConfirmHexString(Local::now(), bytes))
@@ -174,14 +177,17 @@ impl SerialIF {
             }
 
             match serial.read(&mut buffer) {
-                Ok(_) => {
-                    if buffer[0] == b'\n' {
-                        data_tx
-                            .send(DataOut::Data(Local::now(), line.clone()))
-                            .expect("Cannot forward message read from serial");
-                        line.clear();
-                    } else {
-                        line.push(buffer[0] as char);
+                Ok(n) => {
+                    for &byte in &buffer[..n] {
+                        if byte == b'\n' {
+                            let content = String::from_utf8_lossy(&line).into_owned();
+                            data_tx
+                                .send(DataOut::Data(Local::now(), content))
+                                .expect("Cannot forward message read from serial");
+                            line.clear();
+                        } else {
+                            line.push(byte);
+                        }
                     }
                 }
                 Err(ref e) if e.kind() == io::ErrorKind::TimedOut => {}
@@ -1,6 +1,7 @@
 use crate::interface::DataOut;
 use crate::view::View;
 use chrono::{DateTime, Local};
+use std::collections::VecDeque;
 use std::fmt::Write;
 use std::marker::PhantomData;
 use tui::backend::Backend;
@@ -11,23 +12,23 @@ use tui::widgets::{Block, BorderType, Borders, Paragraph, Wrap};
 use tui::Frame;
 
 pub struct TextView<'a, B: Backend> {
-    history: Vec<ViewData<'a>>,
+    history: VecDeque<ViewData<'a>>,
     capacity: usize,
     _marker: PhantomData<B>,
     auto_scroll: bool,
     snapshot_mode_en: bool,
-    snapshot: Vec<ViewData<'a>>,
+    snapshot: VecDeque<ViewData<'a>>,
 }
 
 impl<'a, B: Backend> TextView<'a, B> {
     pub fn new(capacity: usize) -> Self {
         Self {
-            history: vec![],
+            history: VecDeque::new(),
             capacity,
             _marker: PhantomData,
             auto_scroll: true,
             snapshot_mode_en: false,
-            snapshot: vec![],
+            snapshot: VecDeque::new(),
         }
     }
 }
@@ -51,14 +52,14 @@ impl<'a, B: Backend> View for TextView<'a, B> {
 
         let (coll, title, max, coll_size) = if self.snapshot_mode_en {
             (
-                &self.snapshot[(scroll.0 as usize)..],
+                self.snapshot.range((scroll.0 as usize)..),
                 "Snapshot",
                 format!("/{}", self.snapshot.len()),
                 self.snapshot.len(),
             )
         } else {
             (
-                &self.history[(scroll.0 as usize)..],
+                self.history.range((scroll.0 as usize)..),
                 "Normal",
                 "".to_string(),
                 self.history.len(),
@@ -83,7 +84,7 @@ impl<'a, B: Backend> View for TextView<'a, B> {
                 )
         };
 
-        let text = coll.iter().map(|x| x.spans.clone()).collect::<Vec<_>>();
+        let text = coll.map(|x| x.spans.clone()).collect::<Vec<_>>();
         let paragraph = Paragraph::new(text)
             .block(block)
             .wrap(Wrap { trim: false })
@@ -94,7 +95,7 @@ impl<'a, B: Backend> View for TextView<'a, B> {
 
     fn add_data_out(&mut self, data: DataOut) {
         if self.history.len() >= self.capacity {
-            self.history.remove(0);
+            self.history.pop_front();
         }
 
         match data {
@@ -102,27 +103,27 @@ impl<'a, B: Backend> View for TextView<'a, B> {
                 let contents = ViewData::decode_ansi_color(&data);
                 for (content, color) in contents {
                     self.history
-                        .push(ViewData::if_data(timestamp, content, color));
+                        .push_back(ViewData::if_data(timestamp, content, color));
                 }
             }
             DataOut::ConfirmData(timestamp, data) => {
-                self.history.push(ViewData::user_data(timestamp, data))
+                self.history.push_back(ViewData::user_data(timestamp, data))
             }
             DataOut::ConfirmCommand(timestamp, cmd_name, data) => self
                 .history
-                .push(ViewData::user_command(timestamp, cmd_name, data)),
+                .push_back(ViewData::user_command(timestamp, cmd_name, data)),
             DataOut::ConfirmHexString(timestamp, bytes) => self
                 .history
-                .push(ViewData::user_hex_string(timestamp, bytes)),
+                .push_back(ViewData::user_hex_string(timestamp, bytes)),
             DataOut::FailData(timestamp, data) => {
-                self.history.push(ViewData::fail_data(timestamp, data))
+                self.history.push_back(ViewData::fail_data(timestamp, data))
             }
             DataOut::FailCommand(timestamp, cmd_name, _data) => self
                 .history
-                .push(ViewData::fail_command(timestamp, cmd_name)),
+                .push_back(ViewData::fail_command(timestamp, cmd_name)),
             DataOut::FailHexString(timestamp, bytes) => self
                 .history
-                .push(ViewData::fail_hex_string(timestamp, bytes)),
+                .push_back(ViewData::fail_hex_string(timestamp, bytes)),
         };
     }
 
@@ -150,7 +151,7 @@ impl<'a, B: Backend> View for TextView<'a, B> {
             last_index - snapshot_capacity
         };
 
-        self.snapshot = self.history[start..].to_vec();
+        self.snapshot = self.history.range(start..).cloned().collect();
     }
 
     fn toggle_snapshot_mode(&mut self) {
@@ -160,6 +161,17 @@ impl<'a, B: Backend> View for TextView<'a, B> {
     }
 }
 
+const ANSI_COLORS: [Color; 8] = [
+    Color::Black,
+    Color::Red,
+    Color::Green,
+    Color::Yellow,
+    Color::Blue,
+    Color::Magenta,
+    Color::Cyan,
+    Color::Gray,
+];
+
 #[derive(Clone)]
 struct ViewData<'a> {
     length: usize,
@@ -167,64 +179,50 @@ struct ViewData<'a> {
 }
 
 impl<'a> ViewData<'a> {
+    const TIMESTAMP_FORMAT: &'static str = "%d/%m/%Y %H:%M:%S";
+    // Width of the "[{TIMESTAMP_FORMAT}] " prefix built by build_spans, keep both in sync.
+    const TIMESTAMP_LEN: usize = "[dd/mm/YYYY HH:MM:SS] ".len();
+
     fn decode_ansi_color(text: &str) -> Vec<(String, Color)> {
         if text.is_empty() {
             return vec![];
         }
 
-        let splitted = text.split("\x1B[").collect::<Vec<_>>();
         let mut res = vec![];
 
-        let pattern_n_color = [
-            ("0m", Color::White),
-            ("30m", Color::Black),
-            ("0;30m", Color::Black),
-            ("31m", Color::Red),
-            ("0;31m", Color::Red),
-            ("32m", Color::Green),
-            ("0;32m", Color::Green),
-            ("33m", Color::Yellow),
-            ("0;33m", Color::Yellow),
-            ("34m", Color::Blue),
-            ("0;34m", Color::Blue),
-            ("35m", Color::Magenta),
-            ("0;35m", Color::Magenta),
-            ("36m", Color::Cyan),
-            ("0;36m", Color::Cyan),
-            ("37m", Color::Gray),
-            ("0;37m", Color::Gray),
-        ];
-
-        for splitted_str in splitted.iter() {
+        for splitted_str in text.split("\x1B[") {
             if splitted_str.is_empty() {
                 continue;
             }
 
-            if pattern_n_color.iter().all(|(pattern, color)| {
-                if splitted_str.starts_with(pattern) {
-                    let final_str = splitted_str
-                        .to_string()
-                        .replace(pattern, "")
-                        .trim()
-                        .to_string();
-                    if final_str.is_empty() {
-                        return true;
-                    }
-
-                    res.push((final_str, *color));
-                    return false;
-                }
-
-                true
-            }) && !splitted_str.starts_with("0m")
-            {
+            let Some((color, content)) = ViewData::split_color_code(splitted_str) else {
                 res.push((splitted_str.to_string(), Color::White));
+                continue;
+            };
+
+            let content = content.trim();
+            if !content.is_empty() {
+                res.push((content.to_string(), color));
             }
         }
 
         res
     }
 
+    fn split_color_code(text: &str) -> Option<(Color, &str)> {
+        let (code, content) = text.split_once('m')?;
+
+        let color = match code.as_bytes() {
+            [b'0'] => Color::White,
+            [b'3', digit @ b'0'..=b'7'] | [b'0', b';', b'3', digit @ b'0'..=b'7'] => {
+                ANSI_COLORS[(digit - b'0') as usize]
+            }
+            _ => return None,
+        };
+
+        Some((color, content))
+    }
+
     fn bytes_to_hex_string(bytes: &[u8]) -> String {
         let mut hex_string = String::new();
 
@@ -237,12 +235,11 @@ impl<'a> ViewData<'a> {
 
     fn build_spans(timestamp: DateTime<Local>, content: String, fg: Color, bg: Color) -> Spans<'a> {
         let tm_fg = if bg != Color::Reset { bg } else { fg };
+        let timestamp = format!("[{}] ", timestamp.format(ViewData::TIMESTAMP_FORMAT));
+        debug_assert_eq!(timestamp.chars().count(), ViewData::TIMESTAMP_LEN);
 
         Spans::from(vec![
-            Span::styled(
-                format!("[{}] ", timestamp.format("%d/%m/%Y %H:%M:%S")),
-                Style::default().fg(tm_fg),
-            ),
+            Span::styled(timestamp, Style::default().fg(tm_fg)),
             Span::styled(
                 format!("{}{} ", if bg != Color::Reset { " " } else { "" }, content),
                 Style::default().bg(bg).fg(fg),
@@ -250,22 +247,20 @@ impl<'a> ViewData<'a> {
         ])
     }
 
-    fn compute_content_length(timestamp: DateTime<Local>, content: &str) -> usize {
-        let timestamp_str = format!("[{}] ", timestamp.format("%d/%m/%Y %H:%M:%S"));
-
-        timestamp_str.chars().count() + content.chars().count() + 2
+    fn compute_content_length(content: &str) -> usize {
+        ViewData::TIMESTAMP_LEN + content.chars().count() + 2
     }
 
     fn if_data(timestamp: DateTime<Local>, content: String, color: Color) -> Self {
         Self {
-            length: ViewData::compute_content_length(timestamp, &content),
+            length: ViewData::compute_content_length(&content),
             spans: ViewData::build_spans(timestamp, content, color, Color::Reset),
         }
     }
 
     fn user_data(timestamp: DateTime<Local>, content: String) -> Self {
         Self {
-            length: ViewData::compute_content_length(timestamp, &content),
+            length: ViewData::compute_content_length(&content),
             spans: ViewData::build_spans(timestamp, content, Color::Black, Color::LightCyan),
         }
     }
@@ -274,7 +269,7 @@ impl<'a> ViewData<'a> {
         let content = format!("</{cmd_name}> {content}");
 
         Self {
-            length: ViewData::compute_content_length(timestamp, &content),
+            length: ViewData::compute_content_length(&content),
             spans: ViewData::build_spans(timestamp, content, Color::Black, Color::LightGreen),
         }
     }
@@ -283,7 +278,7 @@ impl<'a> ViewData<'a> {
         let content = format!("<${}> {:?}", ViewData::bytes_to_hex_string(&bytes), &bytes);
 
         Self {
-            length: ViewData::compute_content_length(timestamp, &content),
+            length: ViewData::compute_content_length(&content),
             spans: ViewData::build_spans(timestamp, content, Color::Black, Color::Yellow),
         }
     }
@@ -292,7 +287,7 @@ impl<'a> ViewData<'a> {
         let content = format!("Cannot send \"{content}\"");
 
         Self {
-            length: ViewData::compute_content_length(timestamp, &content),
+            length: ViewData::compute_content_length(&content),
             spans: ViewData::build_spans(timestamp, content, Color::White, Color::LightRed),
         }
     }
@@ -301,7 +296,7 @@ impl<'a> ViewData<'a> {
         let content = format!("Cannot send </{cmd_name}>");
 
         Self {
-            length: ViewData::compute_content_length(timestamp, &content),
+            length: ViewData::compute_content_length(&content),
             spans: ViewData::build_spans(timestamp, content, Color::White, Color::LightRed),
         }
     }
@@ -310,8 +305,61 @@ impl<'a> ViewData<'a> {
         let content = format!("Cannot send <${}>", ViewData::bytes_to_hex_string(&bytes));
 
         Self {
-            length: ViewData::compute_content_length(timestamp, &content),
+            length: ViewData::compute_content_length(&content),
             spans: ViewData::build_spans(timestamp, content, Color::White, Color::LightRed),
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn decode(text: &str) -> Vec<(String, Color)> {
+        ViewData::decode_ansi_color(text)
+    }
+
+    #[test]
+    fn test_decode_plain_text() {
+        assert_eq!(
+            decode("plain text"),
+            vec![("plain text".to_string(), Color::White)]
+        );
+    }
+
+    #[test]
+    fn test_decode_color_code() {
+        assert_eq!(decode("\x1b[31mred"), vec![("red".to_string(), Color::Red)]);
+    }
+
+    #[test]
+    fn test_decode_reset_prefixed_color_code() {
+        assert_eq!(decode("\x1b[0;36mx"), vec![("x".to_string(), Color::Cyan)]);
+    }
+
+    #[test]
+    fn test_decode_bare_reset() {
+        assert_eq!(decode("\x1b[0m"), vec![]);
+    }
+
+    #[test]
+    fn test_decode_bare_color_code() {
+        assert_eq!(decode("\x1b[31m"), vec![]);
+    }
+
+    #[test]
+    fn test_decode_unsupported_code() {
+        assert_eq!(
+            decode("\x1b[1;31mx"),
+            vec![("1;31mx".to_string(), Color::White)]
+        );
+    }
+
+    #[test]
+    fn test_decode_keeps_code_text_in_content() {
+        assert_eq!(
+            decode("\x1b[31mtook 31ms"),
+            vec![("took 31ms".to_string(), Color::Red)]
+        );
+    }
+}